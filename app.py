@@ -1,10 +1,7 @@
 import base64
 import os
-from io import BytesIO
 
 import streamlit as st
-from openai import OpenAI
-from PIL import Image
 
 st.set_page_config(page_title="Word → Mandala Art", page_icon="🌀")
 
@@ -27,7 +24,13 @@ if not api_key:
     )
     st.stop()
 
-client = OpenAI(api_key=api_key)
+@st.cache_resource
+def get_client(key: str):
+    # Built once per key and reused across reruns; the openai import (httpx, pydantic, ...)
+    # is deferred until the first Generate click so the page itself renders quickly.
+    from openai import OpenAI
+
+    return OpenAI(api_key=key)
 
 word = st.text_input("Enter a word", placeholder="e.g., serenity", max_chars=40)
 
@@ -50,6 +53,7 @@ if generate:
 
     with st.spinner("Generating mandala..."):
         try:
+            client = get_client(api_key)
             # GPT Image models return base64-encoded image data. :contentReference[oaicite:2]{index=2}
             result = client.images.generate(
                 model="gpt-image-1",
@@ -63,10 +67,9 @@ if generate:
             b64 = result.data[0].b64_json
             img_bytes = base64.b64decode(b64)
 
-            img = Image.open(BytesIO(img_bytes))
-
             st.subheader(f"Mandala for: {w}")
-            st.image(img, use_container_width=True)
+            # st.image takes the encoded PNG as-is; no need to decode it with Pillow first
+            st.image(img_bytes, use_container_width=True)
 
             st.download_button(
                 label="Download PNG",
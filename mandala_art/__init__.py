@@ -1,3 +1,3 @@
 from .generator import render_mandala  # noqa: F401
-from .openai_theme import get_theme_for_word  # noqa: F401
+from .openai_theme import get_theme_for_word, get_themes_for_words  # noqa: F401
 
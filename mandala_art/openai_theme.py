@@ -1,12 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-from typing import Any
+from typing import Iterable
 
-from openai import OpenAI
-
-from .utils import Theme, normalize_theme_dict
+from .utils import Theme, curated_theme, fallback_theme, normalize_theme_dict
 
 
 THEME_SYSTEM = """You generate concise theme specs for mandala art.
@@ -25,20 +24,34 @@ Rules:
 """
 
 
-def _extract_json(text: str) -> dict[str, Any]:
-    text = text.strip()
-    try:
-        return json.loads(text)
-    except Exception:
-        pass
+def _clean_word(word: str) -> str:
+    word = (word or "").strip()
+    return word or "mandala"
+
+
+def _resolve_config(api_key: str | None, model: str | None) -> tuple[str | None, str]:
+    # If api_key is explicitly provided (even as ""), do NOT fall back to env.
+    if api_key is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+    else:
+        api_key = api_key.strip()
+    model = model or os.getenv("OPENAI_MODEL") or "gpt-4o-mini"
+    return api_key, model
 
-    # try to salvage: find first {...} block
-    start = text.find("{")
-    end = text.rfind("}")
-    if start != -1 and end != -1 and end > start:
-        candidate = text[start : end + 1]
-        return json.loads(candidate)
-    raise ValueError("Could not parse JSON from model output")
+
+def _completion_kwargs(word: str, model: str) -> dict:
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": THEME_SYSTEM},
+            {"role": "user", "content": THEME_USER_TEMPLATE.format(word=word)},
+        ],
+        "temperature": 0.8,
+        "response_format": {"type": "json_object"},
+        # Streamed responses keep bytes flowing, so slow generations don't hit
+        # gateway idle limits (e.g. Cloudflare's 100s 524) the way a single response can.
+        "stream": True,
+    }
 
 
 def get_theme_for_word(
@@ -50,36 +63,80 @@ def get_theme_for_word(
 ) -> Theme:
     """
     Uses OpenAI chat model to generate a color palette + motifs.
+    Words with a curated theme (utils.WORD_THEMES) are answered locally, without the API.
     Falls back deterministically when API isn't available.
     """
-    word = (word or "").strip()
-    if not word:
-        word = "mandala"
+    word = _clean_word(word)
+    curated = curated_theme(word)
+    if curated is not None:
+        return curated
 
-    # If api_key is explicitly provided (even as ""), do NOT fall back to env.
-    if api_key is None:
-        api_key = os.getenv("OPENAI_API_KEY")
-    else:
-        api_key = api_key.strip()
-    model = model or os.getenv("OPENAI_MODEL") or "gpt-4o-mini"
+    api_key, model = _resolve_config(api_key, model)
 
     if not api_key:
-        return normalize_theme_dict(word, {})
+        return fallback_theme(word)
 
     try:
+        # Imported lazily: the openai package (httpx, pydantic, ...) is slow to import
+        # and the keyless fallback path never needs it. A failed import falls back too.
+        from openai import OpenAI
+
         client = OpenAI(api_key=api_key, timeout=timeout_s)
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": THEME_SYSTEM},
-                {"role": "user", "content": THEME_USER_TEMPLATE.format(word=word)},
-            ],
-            temperature=0.8,
-        )
-        content = resp.choices[0].message.content or ""
-        data = _extract_json(content)
+        stream = client.chat.completions.create(**_completion_kwargs(word, model))
+        content = "".join(chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices)
+        data = json.loads(content)
         return normalize_theme_dict(word, data)
     except Exception:
         # any error => fallback
-        return normalize_theme_dict(word, {})
+        return fallback_theme(word)
 
+
+async def get_themes_for_words(
+    words: Iterable[str],
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    timeout_s: float = 20.0,
+    max_concurrency: int = 10,
+) -> list[Theme]:
+    """
+    Themes for several words, requested concurrently (at most max_concurrency in flight).
+    Same curated/fallback rules as get_theme_for_word, applied per word; order matches input.
+    """
+    words = [_clean_word(w) for w in words]
+    curated = [curated_theme(w) for w in words]
+    if all(t is not None for t in curated):
+        return curated
+
+    api_key, model = _resolve_config(api_key, model)
+
+    if not api_key:
+        return [fallback_theme(w) for w in words]
+
+    try:
+        from openai import AsyncOpenAI
+
+        client = AsyncOpenAI(api_key=api_key, timeout=timeout_s)
+    except Exception:
+        # any error (including a missing openai package) => fallback
+        return [fallback_theme(w) for w in words]
+
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async with client:
+
+        async def one(word: str, known: Theme | None) -> Theme:
+            if known is not None:
+                return known
+            async with sem:
+                try:
+                    stream = await client.chat.completions.create(**_completion_kwargs(word, model))
+                    parts = [chunk.choices[0].delta.content or "" async for chunk in stream if chunk.choices]
+                    content = "".join(parts)
+                    data = json.loads(content)
+                    return normalize_theme_dict(word, data)
+                except Exception:
+                    # any error => fallback
+                    return fallback_theme(word)
+
+        return list(await asyncio.gather(*(one(w, t) for w, t in zip(words, curated))))
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from operator import attrgetter
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.collections import Collection, EllipseCollection, PathCollection, PolyCollection
+from matplotlib.patches import Circle
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D, Transform
+
+
+# SVG path command per matplotlib path code (CLOSEPOLY takes no coordinates)
+_PATH_COMMANDS = {
+    Path.MOVETO: "M",
+    Path.LINETO: "L",
+    Path.CURVE3: "Q",
+    Path.CURVE4: "C",
+}
+
+
+def _num(v: float) -> str:
+    """Short number for style attributes: at most 3 decimals, no trailing zeros."""
+    s = f"{v:.3f}".rstrip("0").rstrip(".")
+    return s if s not in ("", "-0") else "0"
+
+
+def _hex(rgba: np.ndarray) -> str:
+    r, g, b = (np.clip(rgba[:3], 0.0, 1.0) * 255 + 0.5).astype(int)
+    return f"#{r:02X}{g:02X}{b:02X}"
+
+
+def _paint(prefix: str, rgba: np.ndarray | None) -> dict[str, str]:
+    if rgba is None or rgba[3] <= 0:
+        return {prefix: "none"}
+    style = {prefix: _hex(rgba)}
+    if rgba[3] < 1:
+        style[f"{prefix}-opacity"] = _num(rgba[3])
+    return style
+
+
+def _style(
+    face: np.ndarray | None,
+    edge: np.ndarray | None,
+    linewidth_px: float,
+) -> dict[str, str]:
+    style = _paint("fill", face)
+    if edge is None or edge[3] <= 0 or linewidth_px <= 0:
+        return style
+    style.update(_paint("stroke", edge))
+    style["stroke-width"] = _num(linewidth_px)
+    return style
+
+
+def _attrs(style: dict[str, str]) -> str:
+    return "".join(f' {k}="{v}"' for k, v in style.items())
+
+
+def _path_data(path: Path, to_px: Transform) -> str:
+    """
+    SVG path data, one command letter per run of same-code vertices
+    (SVG repeats the previous command implicitly), formatted run-at-a-time.
+    """
+    verts = to_px.transform(path.vertices)
+    codes = path.codes
+    if codes is None:
+        codes = np.full(len(verts), Path.LINETO, dtype=Path.code_type)
+        codes[0] = Path.MOVETO
+    starts = np.flatnonzero(np.r_[True, (codes[1:] != codes[:-1]) | (codes[1:] == Path.MOVETO)])
+    ends = np.r_[starts[1:], len(codes)]
+
+    parts: list[str] = []
+    for a, b in zip(starts, ends):
+        code = codes[a]
+        if code == Path.STOP:
+            break
+        if code == Path.CLOSEPOLY:
+            parts.append("Z")
+            continue
+        parts.append(_PATH_COMMANDS[code] + " ".join(["%.2f %.2f"] * (b - a)) % tuple(verts[a:b].ravel()))
+    return "".join(parts)
+
+
+def _group(elements: list[tuple[str, dict[str, str]]], extra: dict[str, str] | None = None) -> str:
+    """
+    Emit elements inside one <g>, hoisting style attributes shared by all of them
+    so each element only carries what differs (usually just its fill).
+    """
+    if not elements:
+        return ""
+    shared = dict(elements[0][1])
+    for _, style in elements[1:]:
+        for k in [k for k, v in shared.items() if style.get(k) != v]:
+            del shared[k]
+    shared.update(extra or {})
+    body = "".join(
+        f"<{tag}{_attrs({k: v for k, v in style.items() if k not in shared})}/>" for tag, style in elements
+    )
+    return f"<g{_attrs(shared)}>{body}</g>"
+
+
+def _collection_styles(coll: Collection, n: int, pt_to_px: float) -> list[dict[str, str]]:
+    faces = coll.get_facecolors()
+    edges = coll.get_edgecolors()
+    widths = np.asarray(coll.get_linewidths(), dtype=float).reshape(-1)
+    styles = []
+    for i in range(n):
+        face = faces[i % len(faces)] if len(faces) else None
+        edge = edges[i % len(edges)] if len(edges) else None
+        lw = widths[i % len(widths)] * pt_to_px if len(widths) else 0.0
+        styles.append(_style(face, edge, lw))
+    return styles
+
+
+def _line_attrs(coll: Collection) -> dict[str, str]:
+    return {
+        "stroke-linejoin": coll.get_joinstyle() or "miter",
+        "stroke-linecap": coll.get_capstyle() or "butt",
+    }
+
+
+def axes_to_svg(ax: Axes) -> bytes:
+    """
+    Serialize the mandala axes to a compact SVG.
+
+    Handles exactly the artists render_mandala draws (Circle patches and
+    Ellipse/Path/PolyCollections), in zorder, one <g> per artist. Coordinates
+    are device pixels with 2 decimals; the viewport clips like the axes do.
+    """
+    fig = ax.figure
+    w, h = (int(round(v)) for v in fig.get_size_inches() * fig.dpi)
+    pt_to_px = fig.dpi / 72.0
+    # data -> SVG pixels (SVG's y axis points down)
+    to_svg = ax.transData + Affine2D().scale(1.0, -1.0).translate(0.0, float(h))
+    px_per_unit = abs(to_svg.transform((1.0, 0.0))[0] - to_svg.transform((0.0, 0.0))[0])
+
+    def px(xy: np.ndarray) -> np.ndarray:
+        return to_svg.transform(np.asarray(xy, dtype=float).reshape(-1, 2))
+
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}">',
+        f'<rect width="{w}" height="{h}"{_attrs(_paint("fill", np.asarray(fig.get_facecolor())))}/>',
+    ]
+
+    artists = [a for a in ax.get_children() if isinstance(a, (Circle, Collection)) and a.get_visible()]
+    for artist in sorted(artists, key=attrgetter("zorder")):
+        if isinstance(artist, Circle):
+            ((cx, cy),) = px(artist.get_center())
+            style = _style(
+                np.asarray(artist.get_facecolor()),
+                np.asarray(artist.get_edgecolor()),
+                artist.get_linewidth() * pt_to_px,
+            )
+            r = artist.get_radius() * px_per_unit
+            out.append(f'<circle cx="{cx:.2f}" cy="{cy:.2f}" r="{r:.2f}"{_attrs(style)}/>')
+
+        elif isinstance(artist, EllipseCollection):
+            centers = px(artist.get_offsets())
+            radii = np.asarray(artist.get_widths(), dtype=float) / 2.0 * px_per_unit
+            styles = _collection_styles(artist, len(centers), pt_to_px)
+            elements = [
+                (f'circle cx="{cx:.2f}" cy="{cy:.2f}" r="{r:.2f}"', style)
+                for (cx, cy), r, style in zip(centers, np.broadcast_to(radii, len(centers)), styles)
+            ]
+            out.append(_group(elements))
+
+        elif isinstance(artist, (PathCollection, PolyCollection)):
+            paths = artist.get_paths()
+            styles = _collection_styles(artist, len(paths), pt_to_px)
+            elements = [(f'path d="{_path_data(p, to_svg)}"', style) for p, style in zip(paths, styles)]
+            out.append(_group(elements, _line_attrs(artist)))
+
+    out.append("</svg>")
+    return "".join(out).encode("utf-8")
@@ -1,112 +1,221 @@
 from __future__ import annotations
 
 import colorsys
+import functools
 import hashlib
-import re
+import random
+import sys
 from dataclasses import dataclass
 from typing import Iterable
 
 
-HEX_RE = re.compile(r"^#?[0-9a-fA-F]{6}$")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
 
 
 def _clamp01(x: float) -> float:
     return max(0.0, min(1.0, x))
 
 
+@functools.lru_cache(maxsize=2048)
+def _canonical_hex(color: str) -> str | None:
+    # Cached on the raw string only, so callers' different defaults don't split the cache
+    c = color.strip()
+    if c[:1] == "#":
+        c = c[1:]
+    if len(c) != 6 or not _HEX_DIGITS.issuperset(c):
+        return None
+    # interned: themes share a small set of colors, so equal hexes share one object
+    return sys.intern(f"#{c.upper()}")
+
+
 def normalize_hex(color: str, *, default: str = "#FFFFFF") -> str:
     if not isinstance(color, str):
         return default
-    c = color.strip()
-    if not HEX_RE.match(c):
-        return default
-    if not c.startswith("#"):
-        c = f"#{c}"
-    return c.upper()
+    return _canonical_hex(color) or default
 
 
+# hashlib.sha256 is OpenSSL's constructor, which already dispatches to SHA-NI /
+# ARMv8 SHA2 instructions at runtime; bind it once to skip the module lookup.
+_sha256 = hashlib.sha256
+
+
+@functools.lru_cache(maxsize=4096)
 def stable_int_hash(text: str) -> int:
-    h = hashlib.sha256(text.encode("utf-8")).hexdigest()
-    return int(h[:16], 16)
+    # First 64 bits of the digest, big-endian (same value as int(hexdigest()[:16], 16))
+    return int.from_bytes(_sha256(text.encode("utf-8")).digest()[:8], "big")
 
 
 def hsl_to_hex(h: float, s: float, l: float) -> str:
     # colorsys uses HLS (not HSL): (h, l, s)
     r, g, b = colorsys.hls_to_rgb(h % 1.0, _clamp01(l), _clamp01(s))
-    return "#{:02X}{:02X}{:02X}".format(int(r * 255), int(g * 255), int(b * 255))
+    return "#" + bytes((int(r * 255), int(g * 255), int(b * 255))).hex().upper()
 
 
 def fallback_palette(word: str, *, n: int = 7) -> list[str]:
-    base = stable_int_hash(word.lower().strip() or "mandala")
-    rng = base
-    colors: list[str] = []
-    for i in range(n):
-        # deterministic pseudo-rng using hashing
-        rng = stable_int_hash(f"{word}|{rng}|{i}")
-        h = ((rng >> 8) % 360) / 360.0
-        s = 0.55 + ((rng >> 20) % 35) / 100.0  # 0.55..0.89
-        l = 0.42 + ((rng >> 30) % 20) / 100.0  # 0.42..0.61
-        colors.append(hsl_to_hex(h, s, l))
-    return colors
+    return list(_fallback_palette(word, n))
+
 
+# fallback_palette draws from a fixed grid (360 hues x 35 saturations x 20
+# lightnesses); hex strings are computed on first use of each grid point and shared.
+_FALLBACK_HEX: dict[tuple[int, int, int], str] = {}
 
-def choose_contrasting_bg(palette: Iterable[str]) -> str:
+
+@functools.lru_cache(maxsize=1024)
+def _fallback_palette(word: str, n: int) -> tuple[str, ...]:
+    # One hash seeds a Mersenne Twister (reproducible across Python versions for
+    # integer seeds); each color takes 64 fresh bits instead of another SHA-256.
+    rng = random.Random(stable_int_hash(word.lower().strip() or "mandala"))
+    colors: list[str] = []
+    for _ in range(n):
+        bits = rng.getrandbits(64)
+        key = ((bits >> 8) % 360, (bits >> 20) % 35, (bits >> 30) % 20)
+        color = _FALLBACK_HEX.get(key)
+        if color is None:
+            hi, si, li = key
+            color = hsl_to_hex(hi / 360.0, 0.55 + si / 100.0, 0.42 + li / 100.0)  # s 0.55..0.89, l 0.42..0.61
+            color = _FALLBACK_HEX.setdefault(key, sys.intern(color))
+        colors.append(color)
+    return tuple(colors)
+
+
+def choose_contrasting_bg(palette: Iterable[str], *, normalized: bool = False) -> str:
     # Simple heuristic: default to deep near-black if palette is bright, else off-white.
     # We'll estimate brightness by average channel values.
-    vals = []
-    for c in palette:
-        c = normalize_hex(c, default="#000000")
-        r = int(c[1:3], 16) / 255.0
-        g = int(c[3:5], 16) / 255.0
-        b = int(c[5:7], 16) / 255.0
-        vals.append((r + g + b) / 3.0)
-    if not vals:
+    # normalized=True: palette is already canonical "#RRGGBB" (skip re-validation).
+    if not normalized:
+        palette = (normalize_hex(c, default="#000000") for c in palette)
+    raw = bytes.fromhex("".join(c[1:] for c in palette))
+    if not raw:
         return "#0B0B10"
-    avg = sum(vals) / len(vals)
+    avg = sum(raw) / (255.0 * len(raw))
     return "#0B0B10" if avg > 0.55 else "#FAF7F2"
 
 
-@dataclass(frozen=True)
+# Hand-picked themes for common words. get_theme_for_word answers these locally
+# (no API call or openai import); they also stand in for the hashed fallback palette.
+WORD_THEMES: dict[str, dict] = {
+    "mandala": {
+        "palette": ["#C0392B", "#E67E22", "#F1C40F", "#16A085", "#2980B9", "#8E44AD", "#2C3E50"],
+        "background": "#FAF7F2",
+        "accent": "#E67E22",
+        "mood": "classic and balanced",
+        "motifs": ["petals", "rings", "dots"],
+    },
+    "serenity": {
+        "palette": ["#A8DADC", "#8EC5D6", "#6FA8DC", "#B8C0FF", "#CDB4DB", "#F1FAEE", "#457B9D"],
+        "background": "#0F1B2A",
+        "accent": "#A8DADC",
+        "mood": "calm and airy",
+        "motifs": ["waves", "petals", "rings"],
+    },
+    "ocean": {
+        "palette": ["#03045E", "#023E8A", "#0077B6", "#0096C7", "#00B4D8", "#48CAE4", "#90E0EF"],
+        "background": "#F4FBFD",
+        "accent": "#0077B6",
+        "mood": "deep and flowing",
+        "motifs": ["waves", "shells", "bubbles"],
+    },
+    "lotus": {
+        "palette": ["#F72585", "#F9A8D4", "#FBCFE8", "#B5179E", "#7209B7", "#2D6A4F", "#95D5B2"],
+        "background": "#FFF8FB",
+        "accent": "#F72585",
+        "mood": "gentle and blooming",
+        "motifs": ["petals", "leaves", "water"],
+    },
+    "sun": {
+        "palette": ["#FFBA08", "#FAA307", "#F48C06", "#E85D04", "#DC2F02", "#D00000", "#9D0208"],
+        "background": "#FFFBEA",
+        "accent": "#F48C06",
+        "mood": "warm and radiant",
+        "motifs": ["rays", "flames", "rings"],
+    },
+    "forest": {
+        "palette": ["#081C15", "#1B4332", "#2D6A4F", "#40916C", "#52B788", "#74C69D", "#B7E4C7"],
+        "background": "#F3F8F1",
+        "accent": "#40916C",
+        "mood": "grounded and lush",
+        "motifs": ["leaves", "vines", "seeds"],
+    },
+    "fire": {
+        "palette": ["#370617", "#6A040F", "#9D0208", "#D00000", "#DC2F02", "#E85D04", "#FFBA08"],
+        "background": "#0B0B10",
+        "accent": "#E85D04",
+        "mood": "fierce and bright",
+        "motifs": ["flames", "sparks", "spirals"],
+    },
+    "love": {
+        "palette": ["#590D22", "#800F2F", "#C9184A", "#FF4D6D", "#FF758F", "#FFB3C1", "#FFF0F3"],
+        "background": "#1A0A10",
+        "accent": "#FF4D6D",
+        "mood": "tender and warm",
+        "motifs": ["hearts", "petals", "knots"],
+    },
+    "night": {
+        "palette": ["#F8F9FA", "#CED4DA", "#FFD166", "#7B2CBF", "#5A189A", "#3C096C", "#240046"],
+        "background": "#0B0B10",
+        "accent": "#FFD166",
+        "mood": "quiet and starlit",
+        "motifs": ["stars", "moons", "dots"],
+    },
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Theme:
     word: str
-    palette: list[str]
+    palette: tuple[str, ...]
     background: str
     accent: str
     mood: str
-    motifs: list[str]
+    motifs: tuple[str, ...]
 
     def as_dict(self) -> dict:
+        # palette/motifs are immutable tuples, shared rather than copied (they
+        # serialize to JSON arrays just the same); copy them to mutate.
         return {
             "word": self.word,
-            "palette": list(self.palette),
+            "palette": self.palette,
             "background": self.background,
             "accent": self.accent,
             "mood": self.mood,
-            "motifs": list(self.motifs),
+            "motifs": self.motifs,
         }
 
 
+@functools.lru_cache(maxsize=1024)
+def _normalize_palette(colors: tuple[str | None, ...]) -> tuple[str, ...]:
+    # Themes often repeat the same raw palette (e.g. cached model output); one tuple
+    # lookup replaces per-color validation.
+    return tuple(normalize_hex(c, default="#FFFFFF") for c in colors)
+
+
 def normalize_theme_dict(word: str, data: dict) -> Theme:
     palette_in = data.get("palette") if isinstance(data, dict) else None
     if not isinstance(palette_in, list):
         palette_in = []
-    palette = [normalize_hex(x, default="#FFFFFF") for x in palette_in][:10]
+    # non-str entries (possibly unhashable JSON values) normalize to the default either way
+    palette = _normalize_palette(tuple(x if isinstance(x, str) else None for x in palette_in[:10]))
     if len(palette) < 5:
-        palette = fallback_palette(word, n=7)
+        palette = _fallback_palette(word, 7)
+    # either way every entry is now canonical "#RRGGBB"
 
-    background = normalize_hex(data.get("background", ""), default=choose_contrasting_bg(palette))
+    # `or` rather than default=: the palette scan only runs when no usable background was given
+    background = normalize_hex(data.get("background", ""), default="") or choose_contrasting_bg(
+        palette, normalized=True
+    )
     accent = normalize_hex(data.get("accent", ""), default=palette[0])
     mood = (data.get("mood", "") if isinstance(data, dict) else "") or "themed"
     if not isinstance(mood, str):
         mood = "themed"
-    mood = mood.strip()[:80]
+    # mood/motif words come from a small vocabulary; intern them so themes share them
+    mood = sys.intern(mood.strip()[:80])
 
     motifs_in = data.get("motifs") if isinstance(data, dict) else None
     motifs: list[str] = []
     if isinstance(motifs_in, list):
         for m in motifs_in[:8]:
             if isinstance(m, str) and m.strip():
-                motifs.append(m.strip()[:40])
+                motifs.append(sys.intern(m.strip()[:40]))
     if not motifs:
         motifs = ["petals", "rings", "dots"]
 
@@ -116,6 +225,16 @@ def normalize_theme_dict(word: str, data: dict) -> Theme:
         background=background,
         accent=accent,
         mood=mood,
-        motifs=motifs,
+        motifs=tuple(motifs),
     )
 
+
+def curated_theme(word: str) -> Theme | None:
+    """The hand-picked WORD_THEMES theme for word, or None if it has none."""
+    data = WORD_THEMES.get(word.strip().lower())
+    return normalize_theme_dict(word, data) if data is not None else None
+
+
+def fallback_theme(word: str) -> Theme:
+    """Offline theme: a curated WORD_THEMES entry if there is one, else the hashed palette."""
+    return curated_theme(word) or normalize_theme_dict(word, {})